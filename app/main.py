@@ -1,54 +1,109 @@
 from fastapi import FastAPI, HTTPException
-from dapr.ext.workflow import WorkflowRuntime, DaprWorkflowContext, WorkflowActivityContext
+from fastapi.responses import ORJSONResponse
+from dapr.ext.workflow import WorkflowRuntime, DaprWorkflowContext, WorkflowActivityContext, when_all
 from dapr.clients import DaprClient
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import json
 import logging
+import orjson
+import os
+import threading
+import time
+from cachetools import LRUCache, TTLCache
 from contextlib import asynccontextmanager
-from pydantic import BaseModel
-from typing import List
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, List, Optional
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Simulated activity latency is opt-in: sleeping pins an SDK worker thread
+_DEMO_SLEEP = bool(os.getenv("DEMO_SLEEP"))
+
+# Activity result caches (activities run on the Dapr worker threadpool)
+_ACT_CACHE_LOCK = threading.Lock()
+_PROCESS_CACHE: LRUCache = LRUCache(maxsize=10_000)
+_INVENTORY_CACHE: LRUCache = LRUCache(maxsize=10_000)
+
+def _cache_key(order_data: dict) -> str:
+    """Stable hash of an activity input"""
+    payload = json.dumps(order_data, sort_keys=True).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+def _cache_get(cache: LRUCache, order_data: dict):
+    """Return (key, cached result); key is None when caching is disabled"""
+    if order_data.get("nocache"):
+        return None, None
+    key = _cache_key(order_data)
+    with _ACT_CACHE_LOCK:
+        return key, cache.get(key)
+
+def _cache_put(cache: LRUCache, key, result: dict) -> dict:
+    if key is not None:
+        with _ACT_CACHE_LOCK:
+            cache[key] = result
+    return result
+
 # Workflow Activities
 def process_order_activity(ctx: WorkflowActivityContext, order_data: dict) -> dict:
     """Activity 1: Process the order"""
-    logger.info(f"[Activity 1 - PARALLEL] Processing order: {order_data}")
-    import time
-    time.sleep(2)  # Simulate processing
+    key, cached = _cache_get(_PROCESS_CACHE, order_data)
+    if cached is not None:
+        return cached
+    logger.info("[Activity 1 - PARALLEL] Processing order: %s", order_data)
+    if _DEMO_SLEEP:
+        time.sleep(2)  # Simulate processing
     order_id = order_data.get("order_id")
-    return {
+    return _cache_put(_PROCESS_CACHE, key, {
         "order_id": order_id,
         "status": "processed",
         "total": order_data.get("amount", 0) * 1.1,
         "processed_at": time.time()
-    }
+    })
 
 def check_inventory_activity(ctx: WorkflowActivityContext, order_data: dict) -> dict:
     """Activity 2: Check inventory (runs in parallel with process_order)"""
-    logger.info(f"[Activity 2 - PARALLEL] Checking inventory for order: {order_data}")
-    import time
-    time.sleep(2)  # Simulate inventory check
+    key, cached = _cache_get(_INVENTORY_CACHE, order_data)
+    if cached is not None:
+        return cached
+    logger.info("[Activity 2 - PARALLEL] Checking inventory for order: %s", order_data)
+    if _DEMO_SLEEP:
+        time.sleep(2)  # Simulate inventory check
     items = order_data.get("items", [])
-    return {
+    return _cache_put(_INVENTORY_CACHE, key, {
         "order_id": order_data.get("order_id"),
         "inventory_status": "available",
         "items_count": len(items),
         "checked_at": time.time()
-    }
+    })
+
+# combined_data is built by order_processing_workflow and always has these keys
+_MSG_TMPL = "Order confirmed with {items_count} items. Total: ${total:.2f}"
 
 def send_confirmation_activity(ctx: WorkflowActivityContext, combined_data: dict) -> dict:
     """Activity 3: Send confirmation (runs after parallel activities complete)"""
-    logger.info(f"[Activity 3 - SEQUENTIAL] Sending confirmation with data: {combined_data}")
-    import time
-    time.sleep(1)  # Simulate sending
+    logger.info("[Activity 3 - SEQUENTIAL] Sending confirmation with data: %s", combined_data)
+    if _DEMO_SLEEP:
+        time.sleep(1)  # Simulate sending
     return {
         "confirmation_sent": True,
         "order_id": combined_data.get("order_id"),
-        "message": f"Order confirmed with {combined_data.get('items_count', 0)} items. Total: ${combined_data.get('total', 0):.2f}",
+        "message": _MSG_TMPL.format_map(combined_data),
         "confirmed_at": time.time()
     }
 
+# Static part of every workflow result, built once. Kept a plain dict (with
+# tuple values) because the workflow output is JSON-encoded by the runtime,
+# which cannot serialize MappingProxyType; do not mutate it.
+_EXEC_SUMMARY = {
+    "parallel_activities": ("process_order", "check_inventory"),
+    "sequential_activities": ("send_confirmation",),
+    "total_activities": 3
+}
+
 # Workflow Definition
 def order_processing_workflow(ctx: DaprWorkflowContext, order_input: dict) -> dict:
     """
@@ -56,23 +111,26 @@ def order_processing_workflow(ctx: DaprWorkflowContext, order_input: dict) -> di
     1. Runs process_order and check_inventory in PARALLEL
     2. Runs send_confirmation SEQUENTIALLY after both complete
     """
-    logger.info(f"🚀 Starting workflow for order: {order_input.get('order_id')}")
+    # The runtime replays this generator from the top after every yield;
+    # is_replaying flips to False once execution passes the recorded history
+    if not ctx.is_replaying:
+        logger.info("🚀 Starting workflow for order: %s", order_input.get("order_id"))
+        logger.info("⚡ Launching parallel activities...")
     
     # PARALLEL EXECUTION: Both activities run simultaneously
-    logger.info("⚡ Launching parallel activities...")
     process_task = ctx.call_activity(process_order_activity, input=order_input)
     inventory_task = ctx.call_activity(check_inventory_activity, input=order_input)
     
-    # Wait for both parallel activities to complete
-    process_result = yield process_task
-    inventory_result = yield inventory_task
+    # Wait for both parallel activities to complete (single join point)
+    process_result, inventory_result = yield when_all([process_task, inventory_task])
     
-    logger.info(f"✅ Parallel activities completed")
-    logger.info(f"   - Process result: {process_result}")
-    logger.info(f"   - Inventory result: {inventory_result}")
+    if not ctx.is_replaying:
+        logger.info("✅ Parallel activities completed")
+        logger.info("   - Process result: %s", process_result)
+        logger.info("   - Inventory result: %s", inventory_result)
+        logger.info("📧 Running sequential confirmation activity...")
     
     # SEQUENTIAL EXECUTION: Runs after parallel activities
-    logger.info("📧 Running sequential confirmation activity...")
     combined_data = {
         "order_id": order_input.get("order_id"),
         "total": process_result.get("total"),
@@ -83,7 +141,8 @@ def order_processing_workflow(ctx: DaprWorkflowContext, order_input: dict) -> di
     
     confirmation_result = yield ctx.call_activity(send_confirmation_activity, input=combined_data)
     
-    logger.info(f"✅ Workflow completed for order: {order_input.get('order_id')}")
+    if not ctx.is_replaying:
+        logger.info("✅ Workflow completed for order: %s", order_input.get("order_id"))
     
     return {
         "workflow_status": "completed",
@@ -91,16 +150,161 @@ def order_processing_workflow(ctx: DaprWorkflowContext, order_input: dict) -> di
         "process_result": process_result,
         "inventory_result": inventory_result,
         "confirmation": confirmation_result,
-        "execution_summary": {
-            "parallel_activities": ["process_order", "check_inventory"],
-            "sequential_activities": ["send_confirmation"],
-            "total_activities": 3
-        }
+        "execution_summary": _EXEC_SUMMARY
     }
 
+# Fields read from the SDK's GetWorkflowResponse
+_STATUS_FIELDS = ("runtime_status", "created_at", "last_updated_at", "properties")
+
+# Workflow properties reported by the sidecar
+_OUTPUT_PROPERTY = "dapr.workflow.output"
+_FAILURE_PROPERTY = "dapr.workflow.failure.error_message"
+
+def _as_str(value) -> str:
+    if isinstance(value, str):
+        return value
+    # protobuf Timestamps render as RFC 3339
+    to_json = getattr(value, "ToJsonString", None)
+    return to_json() if to_json is not None else str(value)
+
+# Workflow states that can no longer change
+_TERMINAL_STATUSES = frozenset({"COMPLETED", "FAILED", "TERMINATED"})
+
+def _is_terminal(runtime_status: str) -> bool:
+    # Runtime status renders as "WorkflowRuntimeStatus.COMPLETED"
+    return runtime_status.rsplit(".", 1)[-1] in _TERMINAL_STATUSES
+
+# Terminal statuses never change, but the cache is per process: a purge or
+# re-start handled by one worker is not seen by the others. Only keep them
+# long when a single worker serves the app.
+_TERMINAL_STATUS_TTL_S = float(os.getenv(
+    "TERMINAL_STATUS_TTL_S",
+    "300" if int(os.getenv("WEB_CONCURRENCY", "1")) <= 1 else "1"
+))
+
+def _invalidate_status(instance_id: str) -> None:
+    app.state.status_cache.pop(instance_id, None)
+    app.state.terminal_status_cache.pop(instance_id, None)
+
+# Upper bound on concurrent Dapr SDK (blocking gRPC) calls
+_DAPR_MAX_INFLIGHT = int(os.getenv("DAPR_MAX_INFLIGHT", "32"))
+
+async def _call(fn, **kwargs):
+    """Run a blocking Dapr SDK call on the bounded Dapr thread pool"""
+    async with app.state.dapr_sem:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(app.state.dapr_executor, functools.partial(fn, **kwargs))
+
+# Purge finished instances started by this replica once they are this old
+_PURGE_AFTER_S = float(os.getenv("WORKFLOW_PURGE_AFTER_HOURS", "24")) * 3600
+_PURGE_INTERVAL_S = 300
+# Oldest tracked instances are forgotten beyond this; the state store TTL covers them
+_MAX_TRACKED_INSTANCES = 100_000
+
+def _track_instance(instance_id: str) -> None:
+    tracked = app.state.tracked_instances
+    # Re-insert so the dict stays ordered by start time
+    tracked.pop(instance_id, None)
+    if len(tracked) >= _MAX_TRACKED_INSTANCES:
+        tracked.pop(next(iter(tracked)))
+    tracked[instance_id] = time.monotonic()
+
+def _is_not_found(error: Exception) -> bool:
+    """True if a Dapr SDK error says the workflow instance does not exist"""
+    code = getattr(error, "code", None)
+    if callable(code) and getattr(code(), "name", None) == "NOT_FOUND":
+        return True
+    # DaprInternalError only carries the sidecar's error message
+    message = str(error).lower()
+    return "not found" in message or "no such instance" in message
+
+async def _purge_instance(instance_id: str) -> None:
+    await _call(
+        app.state.dapr.purge_workflow,
+        instance_id=instance_id,
+        workflow_component="dapr"
+    )
+    app.state.tracked_instances.pop(instance_id, None)
+    _invalidate_status(instance_id)
+
+async def _purger():
+    """Periodically purge old terminal workflow instances"""
+    while True:
+        await asyncio.sleep(_PURGE_INTERVAL_S)
+        cutoff = time.monotonic() - _PURGE_AFTER_S
+        for instance_id, started_at in list(app.state.tracked_instances.items()):
+            if started_at > cutoff:
+                continue
+            try:
+                status = await _call(
+                    app.state.dapr.get_workflow,
+                    instance_id=instance_id,
+                    workflow_component="dapr"
+                )
+                runtime_status = getattr(status, "runtime_status", None)
+                if runtime_status is not None and _is_terminal(_as_str(runtime_status)):
+                    await _purge_instance(instance_id)
+                    logger.info("🧹 Purged workflow: %s", instance_id)
+            except Exception as e:
+                if _is_not_found(e):
+                    # Already gone, e.g. expired by the state store TTL
+                    app.state.tracked_instances.pop(instance_id, None)
+                else:
+                    # Keep it for the next pass; the sidecar may be briefly unavailable
+                    logger.warning("Could not purge workflow %s: %s", instance_id, e)
+
+async def _start_instance(instance_id: str, order_data: dict) -> None:
+    await _call(
+        app.state.dapr.start_workflow,
+        workflow_component="dapr",
+        workflow_name="order_processing_workflow",
+        input=order_data,
+        instance_id=instance_id
+    )
+    _invalidate_status(instance_id)
+    _track_instance(instance_id)
+
+# Queued workflow starts, drained in batches by background consumers
+_START_QUEUE_SIZE = 10_000
+_START_BATCH_SIZE = 64
+_START_CONSUMERS = int(os.getenv("START_CONSUMERS", "4"))
+
+async def _start_consumer():
+    """Start queued workflow instances in batches"""
+    queue = app.state.start_queue
+    while True:
+        batch = [await queue.get()]
+        while len(batch) < _START_BATCH_SIZE and not queue.empty():
+            batch.append(queue.get_nowait())
+        outcomes = await asyncio.gather(
+            *[_start_instance(instance_id, order_data) for instance_id, order_data in batch],
+            return_exceptions=True
+        )
+        for (instance_id, _), outcome in zip(batch, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("❌ Error starting workflow %s: %s", instance_id, outcome)
+            else:
+                logger.info("✅ Workflow started: %s", instance_id)
+            queue.task_done()
+
 # Initialize Workflow Runtime
 workflow_runtime = WorkflowRuntime()
 
+# Names already registered with workflow_runtime in this process
+_REGISTERED: set = set()
+
+def _ensure_registered() -> None:
+    """Register the workflow and activities, skipping ones already registered"""
+    if "order_processing_workflow" not in _REGISTERED:
+        workflow_runtime.register_workflow(
+            order_processing_workflow,
+            name="order_processing_workflow")
+        _REGISTERED.add("order_processing_workflow")
+    for activity in (process_order_activity, check_inventory_activity, send_confirmation_activity):
+        if activity.__name__ not in _REGISTERED:
+            workflow_runtime.register_activity(activity)
+            _REGISTERED.add(activity.__name__)
+
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -108,12 +312,7 @@ async def lifespan(app: FastAPI):
     logger.info("🔧 Registering workflows and activities...")
     
     # Register workflow and activities
-    workflow_runtime.register_workflow(
-    order_processing_workflow,
-    name="order_processing_workflow")
-    workflow_runtime.register_activity(process_order_activity)
-    workflow_runtime.register_activity(check_inventory_activity)
-    workflow_runtime.register_activity(send_confirmation_activity)
+    _ensure_registered()
     
     logger.info("🚀 Starting Dapr Workflow Runtime...")
     # Start workflow runtime in background thread
@@ -121,9 +320,46 @@ async def lifespan(app: FastAPI):
     workflow_task = loop.run_in_executor(None, workflow_runtime.start)
     logger.info("✅ Workflow Runtime started successfully")
     
+    # One long-lived Dapr client shared by all requests, so every SDK call
+    # reuses its single gRPC channel instead of reconnecting to the sidecar
+    app.state.dapr = DaprClient()
+    app.state.dapr_sem = asyncio.Semaphore(_DAPR_MAX_INFLIGHT)
+    app.state.dapr_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=_DAPR_MAX_INFLIGHT,
+        thread_name_prefix="dapr"
+    )
+    
+    # Last sidecar health probe as (monotonic time, (status code, body))
+    app.state.health_cache = (0.0, None)
+    app.state.health_executor = concurrent.futures.ThreadPoolExecutor(
+        max_workers=1,
+        thread_name_prefix="dapr-health"
+    )
+    
+    # Short-lived status cache for polling clients; terminal states are immutable
+    app.state.status_cache = TTLCache(maxsize=10_000, ttl=1.0)
+    app.state.terminal_status_cache = TTLCache(maxsize=10_000, ttl=_TERMINAL_STATUS_TTL_S)
+    
+    # Instances started here, purged in the background once finished
+    app.state.tracked_instances = {}
+    purger_task = asyncio.create_task(_purger())
+    
+    app.state.start_queue = asyncio.Queue(maxsize=_START_QUEUE_SIZE)
+    consumer_tasks = [asyncio.create_task(_start_consumer()) for _ in range(_START_CONSUMERS)]
+    
     yield  # Application runs
     
-    # Shutdown
+    # Shutdown: give queued starts a chance to reach the sidecar
+    try:
+        await asyncio.wait_for(app.state.start_queue.join(), timeout=10)
+    except asyncio.TimeoutError:
+        logger.warning("⚠️  %s queued workflow starts dropped on shutdown", app.state.start_queue.qsize())
+    for task in consumer_tasks:
+        task.cancel()
+    purger_task.cancel()
+    app.state.dapr_executor.shutdown(wait=True)
+    app.state.health_executor.shutdown(wait=False)
+    app.state.dapr.close()
     logger.info("🛑 Shutting down Dapr Workflow Runtime...")
     workflow_runtime.shutdown()
     logger.info("✅ Workflow Runtime shutdown complete")
@@ -133,7 +369,8 @@ app = FastAPI(
     title="Dapr Workflow Demo",
     description="Dapr workflow with parallel and sequential activities",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 @app.get("/")
@@ -149,174 +386,290 @@ async def root():
         },
         "endpoints": {
             "start_workflow": "POST /workflow/start",
+            "start_workflow_bulk": "POST /workflow/start_bulk",
             "get_status": "GET /workflow/status/{instance_id}",
             "terminate_workflow": "POST /workflow/terminate/{instance_id}",
+            "purge_workflow": "POST /workflow/purge/{instance_id}",
             "health": "GET /health"
         }
     }
 
+# How long a sidecar health probe result is reused, and how long a probe may take
+_HEALTH_TTL_S = 1.0
+_HEALTH_PROBE_TIMEOUT_S = 1.0
+
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    return {"status": "healthy", "workflow_runtime": "running"}
+    """Health check endpoint; verifies the Dapr sidecar is reachable"""
+    now = time.monotonic()
+    checked_at, cached = app.state.health_cache
+    if cached is None or now - checked_at >= _HEALTH_TTL_S:
+        try:
+            # Runs on its own thread, not behind the shared Dapr semaphore, so
+            # the probe stays fast while starts saturate the Dapr pool
+            loop = asyncio.get_running_loop()
+            await asyncio.wait_for(
+                loop.run_in_executor(app.state.health_executor, app.state.dapr.get_metadata),
+                timeout=_HEALTH_PROBE_TIMEOUT_S
+            )
+            cached = (200, {"status": "healthy", "workflow_runtime": "running", "sidecar": "reachable"})
+        except Exception as e:
+            logger.warning("Dapr sidecar health check failed: %s", e)
+            cached = (503, {"status": "unhealthy", "workflow_runtime": "running", "sidecar": "unreachable"})
+        app.state.health_cache = (now, cached)
+    
+    status_code, body = cached
+    return ORJSONResponse(body, status_code=status_code)
 
-from pydantic import BaseModel
-from typing import List
+# Workflow instance ids are "order_<order_id>"
+_INSTANCE_PREFIX = "order_"
 
 class WorkflowStartRequest(BaseModel):
-    order_id: str
+    model_config = ConfigDict(frozen=True, extra="forbid", populate_by_name=True)
+
+    order_id: str = Field(pattern=r"^[A-Za-z0-9_-]{1,64}$")
     amount: float
     items: List[str]
+    # Bypass the activity result caches for this order
+    nocache: bool = Field(default=False, alias="_nocache")
+
+class WorkflowStartResponse(BaseModel):
+    status: str
+    instance_id: str
+    order_data: WorkflowStartRequest
+    message: str
+
+# Largest batch accepted by /workflow/start_bulk
+_BULK_MAX_ORDERS = 5_000
 
-@app.post("/workflow/start")
+class BulkStartRequest(BaseModel):
+    orders: List[WorkflowStartRequest] = Field(max_length=_BULK_MAX_ORDERS)
+
+class BulkStartResult(BaseModel):
+    instance_id: str
+    status: str
+    error: Optional[str] = None
+
+class WorkflowStatusResponse(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    instance_id: str
+    runtime_status: str
+    created_at: Optional[str] = None
+    last_updated: Optional[str] = None
+    output: Optional[Any] = None
+    failure_details: Optional[str] = None
+
+class WorkflowActionResponse(BaseModel):
+    status: str
+    instance_id: str
+    message: str
+
+# Max concurrent starts per gather() so bulk requests don't flood the sidecar
+_BULK_CHUNK_SIZE = 500
+
+@app.post("/workflow/start", response_model=WorkflowStartResponse, status_code=202)
 async def start_workflow(request: WorkflowStartRequest):
-    """Start a new workflow instance"""
+    """Queue a new workflow instance to be started in the background"""
+    instance_id = _INSTANCE_PREFIX + request.order_id
+    
+    logger.info("🎬 Queueing workflow instance: %s", instance_id)
+    
     try:
-        with DaprClient() as client:
-            order_data = {
-                "order_id": request.order_id,
-                "amount": request.amount,
-                "items": request.items
-            }
-            
-            instance_id = f"order_{request.order_id}"
-            
-            logger.info(f"🎬 Starting workflow instance: {instance_id}")
-            
-            client.start_workflow(
-                workflow_component="dapr",
-                workflow_name="order_processing_workflow",
-                input=order_data,
-                instance_id=instance_id
-            )
-            
-            logger.info(f"✅ Workflow started: {instance_id}")
-            
-            return {
-                "status": "started",
-                "instance_id": instance_id,
-                "order_data": order_data,
-                "message": "Workflow is executing. Use /workflow/status/{instance_id} to check progress"
-            }
-    except Exception as e:
-        logger.error(f"❌ Error starting workflow: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        app.state.start_queue.put_nowait((instance_id, request.model_dump()))
+    except asyncio.QueueFull:
+        logger.warning("⚠️  Start queue full, rejecting workflow: %s", instance_id)
+        raise HTTPException(
+            status_code=503,
+            detail="Workflow start queue is full, retry later",
+            headers={"Retry-After": "1"}
+        )
+    
+    return WorkflowStartResponse(
+        status="accepted",
+        instance_id=instance_id,
+        order_data=request,
+        message="Workflow start has been queued. Use /workflow/status/{instance_id} to check progress"
+    )
 
-@app.get("/workflow/status/{instance_id}")
+@app.post("/workflow/start_bulk", response_model=List[BulkStartResult], response_model_exclude_none=True)
+async def start_workflow_bulk(request: BulkStartRequest):
+    """Start many workflow instances concurrently"""
+    results = []
+    for i in range(0, len(request.orders), _BULK_CHUNK_SIZE):
+        chunk = [order.model_dump() for order in request.orders[i:i + _BULK_CHUNK_SIZE]]
+        instance_ids = [_INSTANCE_PREFIX + order_data["order_id"] for order_data in chunk]
+        outcomes = await asyncio.gather(
+            *[
+                _start_instance(instance_id, order_data)
+                for instance_id, order_data in zip(instance_ids, chunk)
+            ],
+            return_exceptions=True
+        )
+        for instance_id, outcome in zip(instance_ids, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("❌ Error starting workflow %s: %s", instance_id, outcome)
+                results.append(BulkStartResult(instance_id=instance_id, status="failed", error=str(outcome)))
+            else:
+                results.append(BulkStartResult(instance_id=instance_id, status="started"))
+    
+    logger.info("✅ Bulk start finished: %s workflows", len(results))
+    return results
+
+@app.get(
+    "/workflow/status/{instance_id}",
+    response_model=WorkflowStatusResponse,
+    response_model_exclude_none=True
+)
 async def get_workflow_status(instance_id: str):
     """Get the current status of a workflow instance"""
+    cached = app.state.terminal_status_cache.get(instance_id) or app.state.status_cache.get(instance_id)
+    if cached is not None:
+        return cached
+    
     try:
-        with DaprClient() as client:
-            status = client.get_workflow(
-                instance_id=instance_id,
-                workflow_component="dapr"
-            )
-            
-            # Extract runtime status as string
-            runtime_status = str(status.runtime_status) if hasattr(status, 'runtime_status') else "UNKNOWN"
-            
-            # Build response with safe serialization
-            response = {
-                "instance_id": instance_id,
-                "runtime_status": runtime_status,
-            }
-            
-            # Add created_at if available
-            if hasattr(status, 'created_at') and status.created_at:
-                try:
-                    response["created_at"] = str(status.created_at)
-                except:
-                    response["created_at"] = None
-            
-            # Add last_updated if available
-            if hasattr(status, 'last_updated') and status.last_updated:
-                try:
-                    response["last_updated"] = str(status.last_updated)
-                except:
-                    response["last_updated"] = None
-            
-            # Add output if workflow is completed
-            if hasattr(status, 'serialized_output') and status.serialized_output:
-                try:
-                    import json
-                    response["output"] = json.loads(status.serialized_output)
-                except Exception as e:
-                    logger.warning(f"Could not parse workflow output: {e}")
-                    response["output"] = status.serialized_output
-            
-            # Add failure details if workflow failed
-            if hasattr(status, 'failure_details') and status.failure_details:
-                response["failure_details"] = str(status.failure_details)
-            
-            return response
-            
+        client = app.state.dapr
+        status = await _call(
+            client.get_workflow,
+            instance_id=instance_id,
+            workflow_component="dapr"
+        )
+        
+        vals = {f: getattr(status, f, None) for f in _STATUS_FIELDS}
+        
+        runtime_status = _as_str(vals["runtime_status"]) if vals["runtime_status"] is not None else "UNKNOWN"
+        response = {
+            "instance_id": instance_id,
+            "runtime_status": runtime_status,
+        }
+        
+        if vals["created_at"]:
+            response["created_at"] = _as_str(vals["created_at"])
+        if vals["last_updated_at"]:
+            response["last_updated"] = _as_str(vals["last_updated_at"])
+        
+        properties = vals["properties"] or {}
+        
+        # Add output if workflow is completed
+        output = properties.get(_OUTPUT_PROPERTY)
+        if output:
+            try:
+                response["output"] = orjson.loads(output)
+            except orjson.JSONDecodeError as e:
+                logger.warning("Could not parse workflow output: %s", e)
+                response["output"] = output
+        
+        # Add failure details if workflow failed
+        failure = properties.get(_FAILURE_PROPERTY)
+        if failure:
+            response["failure_details"] = failure
+        
+        if _is_terminal(runtime_status):
+            app.state.terminal_status_cache[instance_id] = response
+        else:
+            app.state.status_cache[instance_id] = response
+        
+        return response
+        
     except Exception as e:
-        logger.error(f"❌ Error getting workflow status: {str(e)}")
+        logger.error("❌ Error getting workflow status: %s", e)
         raise HTTPException(status_code=404, detail=f"Workflow not found: {str(e)}")
 
-@app.post("/workflow/terminate/{instance_id}")
+@app.post("/workflow/terminate/{instance_id}", response_model=WorkflowActionResponse)
 async def terminate_workflow(instance_id: str):
     """Terminate a running workflow instance"""
     try:
-        with DaprClient() as client:
-            client.terminate_workflow(
-                instance_id=instance_id,
-                workflow_component="dapr"
-            )
-            
-            logger.info(f"🛑 Terminated workflow: {instance_id}")
-            
-            return {
-                "status": "terminated",
-                "instance_id": instance_id,
-                "message": "Workflow has been terminated"
-            }
+        client = app.state.dapr
+        await _call(
+            client.terminate_workflow,
+            instance_id=instance_id,
+            workflow_component="dapr"
+        )
+        _invalidate_status(instance_id)
+        
+        logger.info("🛑 Terminated workflow: %s", instance_id)
+        
+        return WorkflowActionResponse(
+            status="terminated",
+            instance_id=instance_id,
+            message="Workflow has been terminated"
+        )
     except Exception as e:
-        logger.error(f"❌ Error terminating workflow: {str(e)}")
+        logger.error("❌ Error terminating workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/workflow/pause/{instance_id}")
+@app.post("/workflow/pause/{instance_id}", response_model=WorkflowActionResponse)
 async def pause_workflow(instance_id: str):
     """Pause a running workflow instance"""
     try:
-        with DaprClient() as client:
-            client.pause_workflow(
-                instance_id=instance_id,
-                workflow_component="dapr"
-            )
-            
-            logger.info(f"⏸️  Paused workflow: {instance_id}")
-            
-            return {
-                "status": "paused",
-                "instance_id": instance_id,
-                "message": "Workflow has been paused"
-            }
+        client = app.state.dapr
+        await _call(
+            client.pause_workflow,
+            instance_id=instance_id,
+            workflow_component="dapr"
+        )
+        _invalidate_status(instance_id)
+        
+        logger.info("⏸️  Paused workflow: %s", instance_id)
+        
+        return WorkflowActionResponse(
+            status="paused",
+            instance_id=instance_id,
+            message="Workflow has been paused"
+        )
     except Exception as e:
-        logger.error(f"❌ Error pausing workflow: {str(e)}")
+        logger.error("❌ Error pausing workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/workflow/resume/{instance_id}")
+@app.post("/workflow/resume/{instance_id}", response_model=WorkflowActionResponse)
 async def resume_workflow(instance_id: str):
     """Resume a paused workflow instance"""
     try:
-        with DaprClient() as client:
-            client.resume_workflow(
-                instance_id=instance_id,
-                workflow_component="dapr"
-            )
-            
-            logger.info(f"▶️  Resumed workflow: {instance_id}")
-            
-            return {
-                "status": "resumed",
-                "instance_id": instance_id,
-                "message": "Workflow has been resumed"
-            }
+        client = app.state.dapr
+        await _call(
+            client.resume_workflow,
+            instance_id=instance_id,
+            workflow_component="dapr"
+        )
+        _invalidate_status(instance_id)
+        
+        logger.info("▶️  Resumed workflow: %s", instance_id)
+        
+        return WorkflowActionResponse(
+            status="resumed",
+            instance_id=instance_id,
+            message="Workflow has been resumed"
+        )
+    except Exception as e:
+        logger.error("❌ Error resuming workflow: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/workflow/purge/{instance_id}", response_model=WorkflowActionResponse)
+async def purge_workflow(instance_id: str):
+    """Purge the state of a completed, failed or terminated workflow instance"""
+    try:
+        await _purge_instance(instance_id)
+        
+        logger.info("🧹 Purged workflow: %s", instance_id)
+        
+        return WorkflowActionResponse(
+            status="purged",
+            instance_id=instance_id,
+            message="Workflow state has been purged"
+        )
     except Exception as e:
-        logger.error(f"❌ Error resuming workflow: {str(e)}")
+        logger.error("❌ Error purging workflow: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Multiple workers require the import-string form of the app
+    uvicorn.run(
+        "app.main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        log_level="info"
+    )
\ No newline at end of file